@@ -43,5 +43,5 @@ while True:
         voices[msg.note % len(voices)].press(msg.velocity)
     elif isinstance(msg, NoteOff) or (isinstance(msg, NoteOn) and msg.velocity == 0):
         voices[msg.note % len(voices)].release()
-        if len(list(filter(lambda voice: voice.pressed, voices))) == 0:
+        if not any(voice.pressed for voice in voices):
             led.value = False
@@ -34,6 +34,25 @@ import synthio
 import ulab.numpy as np
 from micropython import const
 
+_LERP_RAMP = np.array([-16385, 16385], dtype=np.int16)
+
+# MicroPython only folds const() at module scope, so the filter type values live here and
+# FilterType simply re-exports them for the public API.
+_LOWPASS = const(0)
+_HIGHPASS = const(1)
+_BANDPASS = const(2)
+
+_INV_127 = 1.0 / 127.0
+
+# The minimum filter resonance, or Q factor, of sqrt(2)/2 for a maximally flat response.
+_MIN_Q = 0.7071067811865475
+
+_INF = float("inf")
+
+# Shared constant for empty note/block results; tuple() returns the same interned object
+# but still pays a builtin lookup and call each time.
+_EMPTY = ()
+
 
 class LerpBlockInput:
     """Creates and manages a :class:`synthio.BlockInput` object to "lerp" (linear interpolation)
@@ -46,9 +65,10 @@ class LerpBlockInput:
 
     def __init__(self, rate: float = 0.05, value: float = 0.0):
         """Constructor method"""
+        self._rate = rate
         self._position = synthio.LFO(
-            waveform=np.linspace(-16385, 16385, num=2, dtype=np.int16),
-            rate=1 / max(rate, 0.001),
+            waveform=_LERP_RAMP,
+            rate=1.0 / (rate if rate > 0.001 else 0.001),
             scale=1,
             offset=0.5,
             once=True,
@@ -56,6 +76,7 @@ class LerpBlockInput:
         self._lerp = synthio.Math(
             synthio.MathOperation.CONSTRAINED_LERP, value, value, self._position
         )
+        self._blocks = (self._position, self._lerp)
 
     @property
     def block(self) -> synthio.BlockInput:
@@ -68,7 +89,7 @@ class LerpBlockInput:
         blocks must be added to the primary :class:`synthio.Synthesizer` object using
         synth.blocks.append(...).
         """
-        return (self._position, self._lerp)
+        return self._blocks
 
     @property
     def value(self) -> float:
@@ -80,18 +101,30 @@ class LerpBlockInput:
 
     @value.setter
     def value(self, value: float) -> None:
-        self._lerp.a = self._lerp.value
-        self._lerp.b = value
+        lerp = self._lerp
+        lerp.a = lerp.value
+        lerp.b = value
         self._position.retrigger()
 
     @property
     def rate(self) -> float:
         """The rate of change of interpolation in seconds. Must be greater than 0.001s."""
-        return 1 / self._position.rate
+        return self._rate
 
     @rate.setter
     def rate(self, value: float) -> None:
-        self._position.rate = 1 / max(value, 0.001)
+        self._rate = value
+        self._position.rate = 1.0 / (value if value > 0.001 else 0.001)
+
+    def _fast_retarget(self, value: float, rate: float) -> None:
+        # Internal combined setter for the value and rate properties which avoids the
+        # per-property descriptor dispatch on hot press/release paths.
+        lerp = self._lerp
+        lerp.a = lerp.value
+        lerp.b = value
+        self._rate = rate
+        self._position.rate = 1.0 / (rate if rate > 0.001 else 0.001)
+        self._position.retrigger()
 
 
 class AREnvelope:
@@ -109,15 +142,22 @@ class AREnvelope:
 
     def __init__(self, attack_time: float = 0.05, release_time: float = 0.05, amount: float = 1.0):
         self._pressed = False
-        self._lerp = LerpBlockInput()
+        self._lerp = None
         self._attack_time = attack_time
         self._release_time = release_time
         self._amount = amount
 
+    def _ensure_lerp(self) -> LerpBlockInput:
+        # The lerp block and its underlying synthio objects are constructed lazily on first
+        # use so that envelopes which are never pressed or routed avoid the allocations.
+        if self._lerp is None:
+            self._lerp = LerpBlockInput()
+        return self._lerp
+
     @property
     def block(self) -> synthio.BlockInput:
         """Get the :class:`synthio.BlockInput` object to be applied to a parameter."""
-        return self._lerp.block
+        return self._ensure_lerp().block
 
     @property
     def blocks(self) -> tuple[synthio.BlockInput]:
@@ -125,12 +165,15 @@ class AREnvelope:
         blocks must be added to the primary :class:`synthio.Synthesizer` object using
         synth.blocks.append(...).
         """
-        return self._lerp.blocks
+        return self._ensure_lerp().blocks
 
     @property
     def value(self) -> float:
         """Get the current value of the envelope."""
-        return self._lerp.value
+        # Read the lerp directly so the per-tick filter update skips the lazy construction
+        # check; an envelope that was never pressed or routed is still at rest.
+        lerp = self._lerp
+        return lerp.value if lerp is not None else 0.0
 
     @property
     def pressed(self) -> bool:
@@ -160,7 +203,7 @@ class AREnvelope:
     @release_time.setter
     def release_time(self, value: float) -> None:
         self._release_time = value
-        if not self._pressed:
+        if not self._pressed and self._lerp is not None:
             self._lerp.rate = self._release_time
 
     @property
@@ -183,15 +226,13 @@ class AREnvelope:
         will start immediately.
         """
         self._pressed = True
-        self._lerp.rate = self._attack_time
-        self._lerp.value = self._amount
+        self._ensure_lerp()._fast_retarget(self._amount, self._attack_time)
 
     def release(self):
         """Deactivate the envelope by setting it into the "released" state. The envelope's release
         phase will start immediately.
         """
-        self._lerp.rate = self._release_time
-        self._lerp.value = 0.0
+        self._ensure_lerp()._fast_retarget(0.0, self._release_time)
         self._pressed = False
 
 
@@ -200,13 +241,13 @@ class FilterType:
     :attr:`Voice.filter_type`.
     """
 
-    LOWPASS = const(0)
+    LOWPASS = _LOWPASS
     """The constant representing a Low-Pass filter or LPF."""
 
-    HIGHPASS = const(1)
+    HIGHPASS = _HIGHPASS
     """The constant representing a High-Pass filter or HPF."""
 
-    BANDPASS = const(2)
+    BANDPASS = _BANDPASS
     """The constant representing a Band-Pass filter or BPF."""
 
 
@@ -227,26 +268,40 @@ class Voice:
         self._notenum = -1
         self._velocity = 0.0
 
-        self._filter_type = FilterType.LOWPASS
-        self._filter_frequency = synthesizer.sample_rate / 2
-        self._filter_resonance = 0.7071067811865475
-        self._filter_buffer = (-1, 0.0, 0.0)
+        # Subclasses populate this tuple once at construction so that press/release and
+        # filter updates never rebuild it.
+        self._notes = _EMPTY
+
+        self._nyquist = synthesizer.sample_rate * 0.5
+
+        self._set_filter_type(_LOWPASS)
+        self._filter_frequency = self._nyquist
+        self._filter_resonance = _MIN_Q
+        self._fb_type = -1
+        self._fb_freq = 0.0
+        self._fb_res = 0.0
 
         self._velocity_amount = 1.0
+        self._update_velocity_mod()
+
+        # Signature of the last envelope build used by subclasses to skip redundant
+        # synthio.Envelope reconstruction.
+        self._env_sig = None
 
     def _append_blocks(self) -> None:
-        for block in self.blocks:
-            self._synthesizer.blocks.append(block)
+        blocks = self.blocks
+        if blocks:
+            self._synthesizer.blocks.extend(blocks)
 
     @property
     def notes(self) -> tuple[synthio.Note]:
         """Get all :class:`synthio.Note` objects attributed to this voice."""
-        return tuple()
+        return self._notes
 
     @property
     def blocks(self) -> tuple[synthio.BlockInput]:
         """Get all :class:`synthio.BlockInput` objects attributed to this voice."""
-        return tuple()
+        return _EMPTY
 
     def press(self, notenum: int, velocity: float | int = 1.0) -> bool:
         """Update the voice to be "pressed" with a specific MIDI note number and velocity. Returns
@@ -260,14 +315,15 @@ class Voice:
             to 1.0. If an :class:`int` value is used, it will be divided by 127 assuming that it is
             a midi velocity value.
         """
-        if type(velocity) is int:
-            velocity /= 127
+        if isinstance(velocity, int):
+            velocity = velocity * _INV_127
         self._velocity = velocity
+        self._update_velocity_mod()
         self._update_envelope()
         if notenum == self._notenum:
             return False
         self._notenum = notenum
-        self._synthesizer.press(self.notes)
+        self._synthesizer.press(self._notes)
         return True
 
     def release(self) -> bool:
@@ -276,14 +332,14 @@ class Voice:
         """
         if not self.pressed:
             return False
-        self._notenum = 0
-        self._synthesizer.release(self.notes)
+        self._notenum = -1
+        self._synthesizer.release(self._notes)
         return True
 
     @property
     def pressed(self) -> bool:
         """Whether or not the voice is currently in a "pressed" state."""
-        return self._notenum > 0
+        return self._notenum >= 0
 
     @property
     def amplitude(self) -> float:
@@ -296,8 +352,18 @@ class Voice:
     def amplitude(self, value: float) -> None:
         pass
 
+    def _update_velocity_mod(self) -> None:
+        # Recomputed only when velocity or velocity_amount changes; _get_velocity_mod
+        # returns the memoized result on every envelope rebuild.
+        velocity = self._velocity
+        if velocity < 0.0:
+            velocity = 0.0
+        elif velocity > 1.0:
+            velocity = 1.0
+        self._velocity_mod = 1.0 - (1.0 - velocity) * self._velocity_amount
+
     def _get_velocity_mod(self) -> float:
-        return 1.0 - (1.0 - min(max(self._velocity, 0.0), 1.0)) * self._velocity_amount
+        return self._velocity_mod
 
     @property
     def velocity_amount(self) -> float:
@@ -309,7 +375,8 @@ class Voice:
 
     @velocity_amount.setter
     def velocity_amount(self, value: float) -> None:
-        self._velocity_amount = min(max(value, 0.0), 1.0)
+        self._velocity_amount = 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+        self._update_velocity_mod()
 
     def _update_envelope(self) -> None:
         pass
@@ -317,26 +384,41 @@ class Voice:
     def _get_filter_frequency(self) -> float:
         return self._filter_frequency
 
+    def _set_filter_type(self, value: int) -> None:
+        # Precompute the biquad factory and the open frequency interval outside of which the
+        # filter is bypassed so that _update_filter stays branch-free.
+        self._filter_type = value
+        if value == _HIGHPASS:
+            self._biquad_factory = self._synthesizer.high_pass_filter
+            self._filter_null_low = 50.0
+            self._filter_null_high = _INF
+        elif value == _BANDPASS:
+            self._biquad_factory = self._synthesizer.band_pass_filter
+            self._filter_null_low = -1.0
+            self._filter_null_high = _INF
+        else:  # _LOWPASS
+            self._biquad_factory = self._synthesizer.low_pass_filter
+            self._filter_null_low = -1.0
+            self._filter_null_high = self._nyquist
+
     def _update_filter(self) -> None:
-        current = (self._filter_type, self._get_filter_frequency(), self._filter_resonance)
-        if self._filter_buffer != current:
-            self._filter_buffer = current
-
-            if self._filter_type == FilterType.LOWPASS:
-                biquad = self._synthesizer.low_pass_filter
-                if current[1] >= self._synthesizer.sample_rate / 2:
-                    biquad = None
-            elif self._filter_type == FilterType.HIGHPASS:
-                biquad = self._synthesizer.high_pass_filter
-                if current[1] <= 50:
-                    biquad = None
-            else:  # FilterType.BANDPASS
-                biquad = self._synthesizer.band_pass_filter
-
-            if biquad is not None:
-                biquad = biquad(current[1], current[2])
-            for note in self.notes:
-                note.filter = biquad
+        freq = self._get_filter_frequency()
+        if (
+            self._fb_type == self._filter_type
+            and self._fb_freq == freq
+            and self._fb_res == self._filter_resonance
+        ):
+            return
+        self._fb_type = self._filter_type
+        self._fb_freq = freq
+        self._fb_res = self._filter_resonance
+
+        if self._filter_null_low < freq < self._filter_null_high:
+            biquad = self._biquad_factory(freq, self._filter_resonance)
+        else:
+            biquad = None
+        for note in self._notes:
+            note.filter = biquad
 
     @property
     def filter_type(self) -> int:
@@ -347,7 +429,7 @@ class Voice:
 
     @filter_type.setter
     def filter_type(self, value: int) -> None:
-        self._filter_type = value
+        self._set_filter_type(value)
         self._update_filter()
 
     @property
@@ -359,19 +441,20 @@ class Voice:
 
     @filter_frequency.setter
     def filter_frequency(self, value: float) -> None:
-        self._filter_frequency = min(max(value, 0), self._synthesizer.sample_rate / 2)
+        nyquist = self._nyquist
+        self._filter_frequency = 0 if value < 0 else (nyquist if value > nyquist else value)
         self._update_filter()
 
     @property
     def filter_resonance(self) -> float:
-        """The resonance of the filter (or Q factor) as a number starting from 0.7. Defaults to
-        0.7.
+        """The resonance of the filter (or Q factor) as a number starting from sqrt(2)/2, or
+        approximately 0.7071. Defaults to 0.7071.
         """
         return self._filter_resonance
 
     @filter_resonance.setter
     def filter_resonance(self, value: float) -> None:
-        self._filter_resonance = max(value, 0.7071067811865475)
+        self._filter_resonance = max(value, _MIN_Q)
         self._update_filter()
 
     def update(self) -> None:
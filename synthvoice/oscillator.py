@@ -15,7 +15,21 @@ try:
 except ImportError:
     pass
 
-_LOG_2 = math.log(2)
+
+_INV_12 = 1.0 / 12.0
+
+# MIDI note numbers cover 0-127, so note frequency is a table read rather than an
+# exponential calculation on every press.
+_MIDI_HZ = tuple(synthio.midi_to_hz(i) for i in range(128))
+
+
+def _clamp01(value: float) -> float:
+    # Cheaper than min(max(value, 0.0), 1.0), which pays two builtin lookups and calls.
+    if value < 0.0:
+        return 0.0
+    if value > 1.0:
+        return 1.0
+    return value
 
 
 class Oscillator(synthvoice.Voice):
@@ -48,8 +62,11 @@ class Oscillator(synthvoice.Voice):
         self._root = root
         self._coarse_tune = 0.0
         self._fine_tune = 0.0
+        self._root_sig = None
+        self._root_freq = root
         self._bend_range = 0.0
         self._bend = 0.0
+        self._pitch_bend_last = 0.0
         self._waveform_loop = (0.0, 1.0)
 
         self._freq_lerp = synthvoice.LerpBlockInput(
@@ -74,6 +91,18 @@ class Oscillator(synthvoice.Voice):
         self._sustain_level = 0.75
         self._release_time = 0.0
 
+        self._bend_math = synthio.Math(
+            synthio.MathOperation.SUM,
+            self._freq_lerp.block,  # Frequency Lerp
+            synthio.LFO(  # Vibrato
+                waveform=None, rate=1.0, scale=0.0, offset=0.0
+            ),
+            synthio.Math(
+                synthio.MathOperation.SUM,
+                self._pitch_slew_lfo,  # Pitch
+                self._pitch_lerp.block,  # Pitch Bend Lerp
+            ),
+        )
         self._note = synthio.Note(
             frequency=self._root,
             waveform=None,
@@ -81,33 +110,11 @@ class Oscillator(synthvoice.Voice):
             amplitude=synthio.LFO(  # Tremolo
                 waveform=None, rate=1.0, scale=0.0, offset=1.0
             ),
-            bend=synthio.Math(
-                synthio.MathOperation.SUM,
-                self._freq_lerp.block,  # Frequency Lerp
-                synthio.LFO(  # Vibrato
-                    waveform=None, rate=1.0, scale=0.0, offset=0.0
-                ),
-                synthio.Math(
-                    synthio.MathOperation.SUM,
-                    self._pitch_slew_lfo,  # Pitch
-                    self._pitch_lerp.block,  # Pitch Bend Lerp
-                ),
-            ),
+            bend=self._bend_math,
             panning=synthio.LFO(waveform=None, rate=1.0, scale=0.0, offset=0.0),
         )
-        self._update_envelope()
-
-        self._append_blocks()
-
-    @property
-    def notes(self) -> tuple[synthio.Note]:
-        """Get all :class:`synthio.Note` objects attributed to this voice."""
-        return tuple([self._note])
-
-    @property
-    def blocks(self) -> tuple[synthio.BlockInput]:
-        """Get all :class:`synthio.BlockInput` objects attributed to this voice."""
-        return (
+        self._notes = (self._note,)
+        self._blocks = (
             self._filter_envelope.blocks
             + self._freq_lerp.blocks
             + self._pitch_lerp.blocks
@@ -115,11 +122,19 @@ class Oscillator(synthvoice.Voice):
                 self._filter_lfo,
                 self._note.amplitude,
                 self._pitch_slew_lfo,
-                self._note.bend,
-                self._note.bend.c,
+                self._bend_math,
+                self._bend_math.c,
                 self._note.panning,
             )
         )
+        self._update_envelope()
+
+        self._append_blocks()
+
+    @property
+    def blocks(self) -> tuple[synthio.BlockInput]:
+        """Get all :class:`synthio.BlockInput` objects attributed to this voice."""
+        return self._blocks
 
     def press(self, notenum: int, velocity: float | int = 1.0) -> bool:
         """Update the voice to be "pressed" with a specific MIDI note number and velocity. Returns
@@ -131,7 +146,7 @@ class Oscillator(synthvoice.Voice):
         """
         if not super().press(notenum, velocity):
             return False
-        self.frequency = synthio.midi_to_hz(notenum)
+        self.frequency = _MIDI_HZ[notenum]
         self._filter_envelope.press()
         self._pitch_slew_lfo.retrigger()
         return True
@@ -146,7 +161,13 @@ class Oscillator(synthvoice.Voice):
         return True
 
     def _update_root(self):
-        self._note.frequency = self._root * pow(2, self._coarse_tune + self._fine_tune / 12)
+        # The exponential only reruns when the tuning actually changed; the note frequency
+        # is always rewritten so that subclasses layering onto it stay correct.
+        sig = (self._root, self._coarse_tune, self._fine_tune)
+        if sig != self._root_sig:
+            self._root_sig = sig
+            self._root_freq = self._root * 2.0 ** (self._coarse_tune + self._fine_tune * _INV_12)
+        self._note.frequency = self._root_freq
 
     @property
     def coarse_tune(self) -> float:
@@ -183,7 +204,7 @@ class Oscillator(synthvoice.Voice):
 
     @frequency.setter
     def frequency(self, value: float) -> None:
-        self._freq_lerp.value = math.log(value / self._root) / _LOG_2
+        self._freq_lerp.value = math.log2(value / self._root)
 
     @property
     def glide(self) -> float:
@@ -197,7 +218,10 @@ class Oscillator(synthvoice.Voice):
         self._freq_lerp.rate = value
 
     def _update_pitch_bend(self):
-        self._pitch_lerp.value = self._bend * self._bend_range
+        value = self._bend * self._bend_range
+        if value != self._pitch_bend_last:
+            self._pitch_bend_last = value
+            self._pitch_lerp.value = value
 
     @property
     def bend_range(self) -> float:
@@ -255,22 +279,22 @@ class Oscillator(synthvoice.Voice):
     @property
     def vibrato_rate(self) -> float:
         """The rate of the frequency LFO in hertz. Defaults to 1.0hz."""
-        return self._note.bend.b.rate
+        return self._bend_math.b.rate
 
     @vibrato_rate.setter
     def vibrato_rate(self, value: float) -> None:
-        self._note.bend.b.rate = value
+        self._bend_math.b.rate = value
 
     @property
     def vibrato_depth(self) -> float:
         """The depth of the frequency LFO in octaves relative to the current note frequency and
         :attr:`bend`. Defaults to 0.0.
         """
-        return self._note.bend.b.scale
+        return self._bend_math.b.scale
 
     @vibrato_depth.setter
     def vibrato_depth(self, value):
-        self._note.bend.b.scale = value
+        self._bend_math.b.scale = value
 
     @property
     def waveform(self) -> ReadableBuffer | None:
@@ -283,24 +307,36 @@ class Oscillator(synthvoice.Voice):
         self._apply_waveform_loop()
 
     def _set_waveform_loop(self, value: tuple[float, float]) -> None:
-        start = min(max(value[0], 0.0), 1.0)
-        end = min(max(value[1], start), 1.0)
+        start = _clamp01(value[0])
+        end = value[1]
+        if end < start:
+            end = start
+        elif end > 1.0:
+            end = 1.0
         self._waveform_loop = (start, end)
         self._apply_waveform_loop()
 
     def _apply_waveform_loop(self) -> None:
-        if self._note.waveform is not None and len(self._note.waveform) >= 2:
-            waveform_length = len(self._note.waveform)
-            self._note.waveform_loop_start = min(
-                max(int(self._waveform_loop[0] * waveform_length), 0), waveform_length - 2
-            )
-            self._note.waveform_loop_end = min(
-                max(
-                    int(self._waveform_loop[1] * waveform_length),
-                    self._note.waveform_loop_start + 2,
-                ),
-                waveform_length,
-            )
+        waveform = self._note.waveform
+        if waveform is None:
+            return
+        length = len(waveform)
+        if length < 2:
+            return
+        loop_start, loop_end = self._waveform_loop
+        start = int(loop_start * length)
+        if start < 0:
+            start = 0
+        elif start > length - 2:
+            start = length - 2
+        end = int(loop_end * length)
+        min_end = start + 2
+        if end < min_end:
+            end = min_end
+        elif end > length:
+            end = length
+        self._note.waveform_loop_start = start
+        self._note.waveform_loop_end = end
 
     @property
     def waveform_loop(self) -> tuple[float, float]:
@@ -378,6 +414,17 @@ class Oscillator(synthvoice.Voice):
 
     def _update_envelope(self):
         mod = self._get_velocity_mod()
+        sig = (
+            mod,
+            self._attack_time,
+            self._attack_level,
+            self._decay_time,
+            self._sustain_level,
+            self._release_time,
+        )
+        if sig == self._env_sig:
+            return
+        self._env_sig = sig
         self._note.envelope = synthio.Envelope(
             attack_time=self._attack_time,
             attack_level=mod * self._attack_level,
@@ -407,7 +454,7 @@ class Oscillator(synthvoice.Voice):
 
     @attack_level.setter
     def attack_level(self, value: float) -> None:
-        self._attack_level = min(max(value, 0.0), 1.0)
+        self._attack_level = _clamp01(value)
         self._update_envelope()
 
     @property
@@ -432,7 +479,7 @@ class Oscillator(synthvoice.Voice):
 
     @sustain_level.setter
     def sustain_level(self, value: float) -> None:
-        self._sustain_level = min(max(value, 0.0), 1.0)
+        self._sustain_level = _clamp01(value)
         self._update_envelope()
 
     @property
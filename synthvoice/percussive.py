@@ -14,6 +14,55 @@ try:
 except ImportError:
     pass
 
+# The falling-edge waveform used by every voice's pitch envelope LFO.
+_LFO_WAVEFORM = np.array([32767, -32768], dtype=np.int16)
+
+# Identical waveform buffers shared between voices, generated lazily on first use.
+_waveform_cache = {}
+
+
+def _get_noise() -> ReadableBuffer:
+    waveform = _waveform_cache.get("noise")
+    if waveform is None:
+        # Sized to match the shared sine table so the two can be mixed element-wise.
+        waveform = _waveform_cache["noise"] = synthwaveform.noise(size=1024)
+    return waveform
+
+
+def _get_sine() -> ReadableBuffer:
+    waveform = _waveform_cache.get("sine")
+    if waveform is None:
+        # A single larger table keeps quantization noise low across the audible range and
+        # only pays the generation cost once for every voice that uses it.
+        waveform = _waveform_cache["sine"] = synthwaveform.sine(size=1024)
+    return waveform
+
+
+def _get_triangle() -> ReadableBuffer:
+    waveform = _waveform_cache.get("triangle")
+    if waveform is None:
+        waveform = _waveform_cache["triangle"] = synthwaveform.triangle()
+    return waveform
+
+
+def _get_quiet_noise() -> ReadableBuffer:
+    # The quarter-amplitude noise layered under each tom's triangle wave.
+    waveform = _waveform_cache.get("quiet_noise")
+    if waveform is None:
+        waveform = _waveform_cache["quiet_noise"] = synthwaveform.noise(amplitude=0.25)
+    return waveform
+
+
+def _get_sine_offset() -> ReadableBuffer:
+    # The 180 degree phase-shifted sine is an index rotation of the shared table rather
+    # than a second run of the generator.
+    waveform = _waveform_cache.get("sine_offset")
+    if waveform is None:
+        sine = _get_sine()
+        half = len(sine) // 2
+        waveform = _waveform_cache["sine_offset"] = np.concatenate((sine[half:], sine[:half]))
+    return waveform
+
 
 class Voice(synthvoice.Voice):
     """Base single-shot "analog" drum voice used by other classes within the percussive module.
@@ -46,15 +95,15 @@ class Voice(synthvoice.Voice):
         super().__init__(synthesizer)
 
         if not frequencies:
-            frequencies = tuple([440.0])
+            frequencies = (440.0,)
         if not times:
-            times = tuple([1.0])
+            times = (1.0,)
 
         self._times = times
         self._attack_level = 1.0
 
         self._lfo = synthio.LFO(
-            waveform=np.array([32767, -32768], dtype=np.int16),
+            waveform=_LFO_WAVEFORM,
             rate=20.0,
             scale=0.3,
             offset=0.33,
@@ -67,6 +116,9 @@ class Voice(synthvoice.Voice):
                 synthio.Note(frequency=frequencies[i % len(frequencies)], bend=self._lfo)
             )
         self._notes = tuple(self._notes)
+        self._blocks = (self._lfo,)
+        self._frequencies = tuple(note.frequency for note in self._notes)
+        self._waveforms = (None,) * count
 
         self.times = times
         self.waveforms = waveforms
@@ -74,31 +126,35 @@ class Voice(synthvoice.Voice):
         self.filter_type = filter_type
         self.filter_frequency = filter_frequency
 
-    @property
-    def notes(self) -> tuple[synthio.Note]:
-        """Get all :class:`synthio.Note` objects attributed to this voice."""
-        return self._notes
-
     @property
     def blocks(self) -> tuple[synthio.BlockInput]:
         """Get all :class:`synthio.BlockInput` objects attributed to this voice."""
-        return tuple([self._lfo])
+        return self._blocks
 
     @property
     def frequencies(self) -> tuple[float]:
         """The base frequencies in hertz."""
-        value = []
-        for note in self.notes:
-            value.append(note.frequency)
-        return tuple(value)
+        return self._frequencies
 
     @frequencies.setter
     def frequencies(self, value: tuple[float] | float) -> None:
-        if not isinstance(value, tuple):
-            value = tuple([value])
+        if not isinstance(value, (tuple, list)):
+            value = (value,)
         if value:
-            for i, note in enumerate(self.notes):
-                note.frequency = value[i % len(value)]
+            notes = self._notes
+            count = len(value)
+            if count == 1:
+                frequency = value[0]
+                for note in notes:
+                    note.frequency = frequency
+                self._frequencies = (frequency,) * len(notes)
+            else:
+                # Expand the wrapped values once so the note loop pairs directly with zip
+                # instead of computing an index modulo per note.
+                expanded = tuple(value[i % count] for i in range(len(notes)))
+                for note, frequency in zip(notes, expanded):
+                    note.frequency = frequency
+                self._frequencies = expanded
 
     @property
     def times(self) -> tuple[float]:
@@ -107,10 +163,12 @@ class Voice(synthvoice.Voice):
 
     @times.setter
     def times(self, value: tuple[float] | float) -> None:
-        if not isinstance(value, tuple):
-            value = tuple([value])
+        if not isinstance(value, (tuple, list)):
+            value = (value,)
         if value:
-            self._times = value
+            # Copy into a tuple so the getter keeps its documented type and the envelope
+            # signature cache isn't defeated by a caller mutating their list in place.
+            self._times = tuple(value)
             self._update_envelope()
 
     @property
@@ -118,19 +176,26 @@ class Voice(synthvoice.Voice):
         """The note waveforms as :class:`ulab.numpy.ndarray` objects with the
         :class:`ulab.numpy.int16` data type.
         """
-        value = []
-        for note in self.notes:
-            value.append(note.waveform)
-        return tuple(value)
+        return self._waveforms
 
     @waveforms.setter
     def waveforms(self, value: tuple[ReadableBuffer] | ReadableBuffer) -> None:
         if not value:
             return
-        if not isinstance(value, tuple):
-            value = tuple([value])
-        for i, note in enumerate(self.notes):
-            note.waveform = value[i % len(value)]
+        if not isinstance(value, (tuple, list)):
+            value = (value,)
+        notes = self._notes
+        count = len(value)
+        if count == 1:
+            waveform = value[0]
+            for note in notes:
+                note.waveform = waveform
+            self._waveforms = (waveform,) * len(notes)
+        else:
+            expanded = tuple(value[i % count] for i in range(len(notes)))
+            for note, waveform in zip(notes, expanded):
+                note.waveform = waveform
+            self._waveforms = expanded
 
     def press(self, velocity: float | int = 1.0) -> bool:
         """Update the voice to be "pressed". For percussive voices, this will begin the playback of
@@ -156,19 +221,39 @@ class Voice(synthvoice.Voice):
 
     @amplitude.setter
     def amplitude(self, value: float) -> None:
-        for note in self.notes:
-            note.amplitude = min(max(value, 0.0), 1.0)
+        if value < 0.0:
+            value = 0.0
+        elif value > 1.0:
+            value = 1.0
+        for note in self._notes:
+            note.amplitude = value
 
     def _update_envelope(self) -> None:
-        mod = self._get_velocity_mod()
-        for i, note in enumerate(self.notes):
-            note.envelope = synthio.Envelope(
-                attack_time=0.0,
-                decay_time=self._times[i % len(self._times)],
-                release_time=0.0,
-                attack_level=mod * self._attack_level,
-                sustain_level=0.0,
-            )
+        level = self._get_velocity_mod() * self._attack_level
+        sig = (level, self._times)
+        if sig == self._env_sig:
+            return
+        self._env_sig = sig
+        notes = self._notes
+        times = self._times
+        count = len(times)
+        if count < len(notes):
+            times = tuple(times[i % count] for i in range(len(notes)))
+        envelope = synthio.Envelope
+        built = {}
+        for note, time in zip(notes, times):
+            # synthio.Envelope is immutable, so notes sharing a decay time (such as the
+            # outer cymbal notes) share one envelope object instead of building duplicates.
+            env = built.get(time)
+            if env is None:
+                env = built[time] = envelope(
+                    attack_time=0.0,
+                    decay_time=time,
+                    release_time=0.0,
+                    attack_level=level,
+                    sustain_level=0.0,
+                )
+            note.envelope = env
 
     @property
     def attack_level(self) -> float:
@@ -185,8 +270,8 @@ class Kick(Voice):
     """A single-shot "analog" drum voice representing a low frequency sine-wave kick drum."""
 
     def __init__(self, synthesizer: synthio.Synthesizer):
-        sine = synthwaveform.sine()
-        offset_sine = synthwaveform.sine(phase=0.5)
+        sine = _get_sine()
+        offset_sine = _get_sine_offset()
         super().__init__(
             synthesizer,
             count=3,
@@ -203,14 +288,14 @@ class Snare(Voice):
     """
 
     def __init__(self, synthesizer: synthio.Synthesizer):
-        sine_noise = synthwaveform.mix(
-            synthwaveform.sine(),
-            (synthwaveform.noise(), 0.5),
-        )
-        offset_sine_noise = synthwaveform.mix(
-            synthwaveform.sine(phase=0.5),
-            (synthwaveform.noise(), 0.5),
-        )
+        # Mix the sine and noise waveforms in a single vectorized ulab expression, scaled by
+        # the total mix amplitude to avoid clipping. The phase-offset variant is an index
+        # rotation of the mixed buffer rather than a second full mix.
+        sine = np.array(_get_sine(), dtype=np.float)
+        noise = np.array(_get_noise(), dtype=np.float)
+        sine_noise = np.array((sine + noise * 0.5) * (1.0 / 1.5), dtype=np.int16)
+        half = len(sine_noise) // 2
+        offset_sine_noise = np.concatenate((sine_noise[half:], sine_noise[:half]))
         super().__init__(
             synthesizer,
             count=3,
@@ -241,10 +326,11 @@ class Cymbal(Voice):
             filter_type=synthvoice.FilterType.HIGHPASS,
             filter_frequency=frequency,
             frequencies=(90, 135, 165.0),
-            waveforms=synthwaveform.noise(),
+            waveforms=_get_noise(),
         )
         self._min_time = max(min_time, 0.0)
         self._max_time = max(max_time, self._min_time)
+        self._time_span = self._max_time - self._min_time
         self.decay = 0.5
 
     @property
@@ -256,9 +342,9 @@ class Cymbal(Voice):
 
     @decay.setter
     def decay(self, value: float) -> None:
-        self._decay = min(max(value, 0.0), 1.0)
-        value = self._decay * (self._max_time - self._min_time) + self._min_time
-        self.times = (value, max(value - 0.02, 0.0), value)
+        self._decay = 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+        value = self._decay * self._time_span + self._min_time
+        self.times = (value, value - 0.02 if value > 0.02 else 0.0, value)
 
 
 class ClosedHat(Cymbal):
@@ -307,14 +393,16 @@ class Tom(Voice):
             synthesizer,
             count=2,
             filter_frequency=4000.0,
-            waveforms=(synthwaveform.triangle(), synthwaveform.noise(amplitude=0.25)),
+            waveforms=(_get_triangle(), _get_quiet_noise()),
         )
         self._min_time = max(min_time, 0.0)
         self._max_time = max(max_time, self._min_time)
+        self._time_span = self._max_time - self._min_time
         self.decay = 0.5
 
         self._min_frequency = max(min_frequency, 0.0)
         self._max_frequency = max(max_frequency, self._min_frequency)
+        self._freq_span = self._max_frequency - self._min_frequency
         self.frequency = 0.5
 
     @property
@@ -327,7 +415,7 @@ class Tom(Voice):
     @decay.setter
     def decay(self, value: float) -> None:
         self._decay = min(max(value, 0.0), 1.0)
-        self.times = (self._decay * (self._max_time - self._min_time) + self._min_time, 0.025)
+        self.times = (self._decay * self._time_span + self._min_time, 0.025)
 
     @property
     def frequency(self) -> float:
@@ -339,9 +427,10 @@ class Tom(Voice):
     @frequency.setter
     def frequency(self, value: float) -> None:
         self._frequency = min(max(value, 0.0), 1.0)
-        self.frequencies = (
-            self._frequency * (self._max_frequency - self._min_frequency) + self._min_frequency
-        )
+        value = self._frequency * self._freq_span + self._min_frequency
+        for note in self._notes:
+            note.frequency = value
+        self._frequencies = (value,) * len(self._notes)
 
 
 class HighTom(Tom):
@@ -17,8 +17,47 @@ _LOG_2 = math.log(2)
 
 
 def is_pow2(value: float | int) -> bool:
-    value = math.log(value) / _LOG_2
-    return math.ceil(value) == math.floor(value)
+    whole = int(value)
+    return whole == value and whole > 0 and not whole & (whole - 1)
+
+
+def _fft_prepare(data: np.ndarray, length: int) -> np.ndarray:
+    # Shared preprocessing for fft and fftfreq: trim to the requested window, center
+    # unsigned data, and truncate to a power-of-two length.
+    size = len(data)
+    if size > length:
+        offset = (size - length) // 2
+        data = data[offset : size - offset]
+
+    if data.dtype == np.uint16:
+        mean = int(np.mean(data))
+        try:
+            # Reinterpret the sample buffer as int16 and recenter with wrap-around
+            # arithmetic, which skips the 4-bytes-per-sample float intermediate and halves
+            # peak RAM during the conversion.
+            data = np.frombuffer(data, dtype=np.int16) - (mean - 0x10000 if mean > 0x7FFF else mean)
+        except (AttributeError, TypeError, ValueError):
+            # Fall back to centering through a float intermediate; casting to int16 before
+            # subtracting would clip samples above the signed maximum.
+            data = np.array(np.array(data, dtype=np.float) - mean, dtype=np.int16)
+    elif data.dtype != np.int16:
+        raise ValueError("Invalid data type")
+
+    # Ensure that data length is a power of 2
+    length = len(data)
+    if length < 2:
+        return None
+    if length & (length - 1):
+        data = data[: 1 << (length.bit_length() - 1)]
+    return data
+
+
+def _fft_argmax(data: np.ndarray) -> tuple[int, int]:
+    # Peak bin search over the usable half of the linear-magnitude spectrum. Skips the log
+    # scaling entirely and only slices the spectrum once for the search.
+    spec = ulab.utils.spectrogram(data)
+    length = (len(spec) // 2) - 2
+    return int(np.argmax(spec[1 : length + 1])), length
 
 
 def fft(data: np.ndarray, log: bool = True, length: int = 1024) -> np.ndarray:
@@ -32,27 +71,9 @@ def fft(data: np.ndarray, log: bool = True, length: int = 1024) -> np.ndarray:
     :param length: The resulting length of the spectrogram array. A larger value will be more
         precise but require more processing and RAM usage.
     """
-    if len(data) > length:
-        offset = (len(data) - length) // 2
-        data = data[offset : len(data) - offset]
-
-    if data.dtype == np.uint16:
-        mean = int(np.mean(data))
-        data = np.array([x - mean for x in data], dtype=np.int16)
-    elif data.dtype != np.int16:
-        raise ValueError("Invalid data type")
-
-    # Ensure that data length is a power of 2
-    if len(data) < 2:
+    data = _fft_prepare(data, length)
+    if data is None:
         return None
-    if not is_pow2(len(data)):
-        j = 2
-        while True:
-            j *= 2
-            if j > len(data):
-                data = data[: int(j // 2)]
-                break
-
     data = ulab.utils.spectrogram(data)
     data = data[1 : (len(data) // 2) - 1]
     if log:
@@ -68,27 +89,35 @@ def fftfreq(data: np.ndarray, sample_rate: int):
         be raised.
     :param sample_rate: The rate at which the data was recorded in hertz.
     """
-    data = fft(data, log=False)
-    freq = np.argmax(data) / len(data) * sample_rate / 4
-    del data
-    return freq
+    index, length = _fft_argmax(_fft_prepare(data, 1024))
+    return index / length * sample_rate / 4
 
 
-def normalize(data: np.ndarray) -> np.ndarray:
+def normalize(data: np.ndarray, buffer: np.ndarray = None) -> np.ndarray:
     """Scale the data so that it reaches the maximum peak capable of the data type (+32767 for
     :class:`ulab.numpy.int16`).
 
     :param data: The data to be normalized, typically audio samples. The data type must be
         :class:`ulab.numpy.int16` or else a :class:`ValueError` will be raised.
+    :param buffer: An optional reusable :class:`ulab.numpy.float` scratch array at least as long
+        as the data. Providing one avoids allocating a fresh intermediate buffer on every call,
+        which helps reduce heap fragmentation when loading samples repeatedly.
     """
     if data.dtype != np.int16:
         raise ValueError("Invalid data type")
     max_level = np.max(data)
-    if max_level < 32767.0:
-        data = np.array(
-            np.clip(np.array(data, dtype=np.float) * 32767 / max_level, -32768, 32767),
-            dtype=np.int16,
-        )
+    # Silent data has no peak to scale to; leave it untouched instead of dividing by zero.
+    if 0 < max_level < 32767.0:
+        # Scale in place with a precomputed factor to avoid the extra full-length buffers
+        # that the chained multiply and divide would allocate.
+        size = len(data)
+        if buffer is not None and len(buffer) >= size:
+            scratch = buffer[:size]
+            scratch[:] = data
+        else:
+            scratch = np.array(data, dtype=np.float)
+        scratch *= 32767.0 / max_level
+        data = np.array(np.clip(scratch, -32768, 32767), dtype=np.int16)
     return data
 
 
@@ -121,9 +150,13 @@ class Sample(synthvoice.oscillator.Oscillator):
         self._sample_rate = synthesizer.sample_rate
         self._sample_tune = 0.0
         self._loop_tune = 0.0
+        self._tune_factor = 1.0
         self._start = None
         self._desired_frequency = self._root
         self._max_size = max_size
+        self._source_waveform = None
+        self._source_rate = None
+        self._scratch = None
 
         if file:
             self.file = file
@@ -131,19 +164,29 @@ class Sample(synthvoice.oscillator.Oscillator):
             self.file = None
 
     def _update_source_root(self) -> None:
-        if self._note.waveform is not None:
+        waveform = self._note.waveform
+        if waveform is self._source_waveform and self._sample_rate == self._source_rate:
+            # Neither input of the FFT analysis changed; reuse the cached root properties.
+            self._update_root()
+            return
+        self._source_waveform = waveform
+        self._source_rate = self._sample_rate
+        if waveform is not None:
             self._root = fftfreq(
-                data=self._note.waveform,
+                data=waveform,
                 sample_rate=self._sample_rate,
             )
             self._cycle_duration = 1 / self._root
-            self._source_duration = len(self._note.waveform) / self._sample_rate
+            self._source_duration = len(waveform) / self._sample_rate
             self._source_tune = math.log(self._cycle_duration / self._source_duration) / _LOG_2
         else:
             self._root = self._desired_frequency
             self._cycle_duration = 1.0 / self._root
             self._source_duration = 0.0
             self._source_tune = 0.0
+        # The combined tuning exponential only changes here and in the waveform_loop
+        # setter, so it is cached rather than recomputed on every root update.
+        self._tune_factor = 2.0 ** (self._source_tune + self._loop_tune)
         self._update_root()
 
     @property
@@ -171,7 +214,11 @@ class Sample(synthvoice.oscillator.Oscillator):
             self._note.waveform = None
         else:
             waveform, self.sample_rate = synthwaveform.from_wav(value, self._max_size)
-            self.waveform = normalize(waveform)
+            if self._scratch is None:
+                # Allocated once on the first load and reused for every subsequent file
+                # assignment so repeated loads don't fragment the heap.
+                self._scratch = np.zeros(self._max_size, dtype=np.float)
+            self.waveform = normalize(waveform, self._scratch)
         self._update_source_root()
 
     def press(self, notenum: int, velocity: float | int = 1.0) -> bool:
@@ -198,7 +245,7 @@ class Sample(synthvoice.oscillator.Oscillator):
         return (
             self._source_duration
             * self._root
-            / pow(2, self._note.bend.value)
+            / 2.0**self._note.bend.value
             / self._desired_frequency
         )
 
@@ -225,11 +272,12 @@ class Sample(synthvoice.oscillator.Oscillator):
         self._loop_tune = (
             math.log(sample_length / length) / _LOG_2 if length != sample_length else 0.0
         )
+        self._tune_factor = 2.0 ** (self._source_tune + self._loop_tune)
         self._update_root()
 
     def _update_root(self):
         super()._update_root()
-        self._note.frequency = self._note.frequency * pow(2, self._source_tune + self._loop_tune)
+        self._note.frequency = self._note.frequency * self._tune_factor
 
     def update(self):
         """Update filter modulation and sample timing when :attr:`looping` is set to `False`."""